@@ -4,16 +4,41 @@ Fetch trending AI skill/agent projects from GitHub.
 Searches for repositories related to AI agents, skills, and related topics.
 """
 
+import base64
+import heapq
+import http.client
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
-from urllib.request import Request, urlopen
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable
 from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 GITHUB_API_BASE = "https://api.github.com"
 
+ETAG_CACHE_PATH = os.path.join(".cache", "etags.json")
+
+# One keep-alive connection per worker thread, so the TLS handshake is paid
+# once per thread instead of once per request.
+_thread_local = threading.local()
+
 SEARCH_QUERIES = [
     "ai-agent",
     "llm-agent",
@@ -39,10 +64,122 @@ TOPICS = [
     "anthropic",
 ]
 
+# Upper bound on in-flight API requests, kept low to stay clear of GitHub's
+# secondary rate limit.
+MAX_CONCURRENT_REQUESTS = 10
+
+# Redirects are followed like urlopen would, up to this many hops.
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+
+# Rate-limited requests are retried this many times, honouring GitHub's
+# Retry-After / X-RateLimit-Reset headers. Waits longer than MAX_RETRY_WAIT
+# seconds are not worth blocking the run for and fail immediately instead;
+# that still covers a full one-minute search rate limit window.
+MAX_RATE_LIMIT_RETRIES = 3
+MAX_RETRY_WAIT = 60
+
+# Fields of a search result item read by normalize_repo. The rest of the
+# ~80 fields GitHub returns per item are dropped as soon as they are parsed.
+REPO_FIELDS = frozenset({
+    "id", "name", "full_name", "description", "html_url",
+    "stargazers_count", "forks_count", "open_issues_count", "watchers_count",
+    "language", "topics", "created_at", "updated_at", "pushed_at",
+    "owner", "license", "homepage", "archived", "fork",
+})
+
 def get_github_token() -> str | None:
     return os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
 
-def make_request(url: str, token: str | None = None) -> dict[str, Any]:
+def load_etag_cache(path: str) -> dict[str, Any]:
+    """Load the {url: {"etag", "data"}} cache written by a previous run."""
+    try:
+        body = Path(path).read_bytes()
+        return orjson.loads(body) if orjson else json.loads(body)
+    except (OSError, ValueError):
+        return {}
+
+def save_etag_cache(cache: dict[str, Any], path: str) -> None:
+    cache_path = Path(path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(orjson.dumps(cache) if orjson else json.dumps(cache, ensure_ascii=False).encode("utf-8"))
+
+def open_connection(host: str) -> http.client.HTTPSConnection:
+    """Connect to host, tunnelling through HTTPS_PROXY unless NO_PROXY exempts host, as urlopen does."""
+    proxy = getproxies().get("https")
+    if not proxy or proxy_bypass(host):
+        return http.client.HTTPSConnection(host, timeout=30)
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    proxy_parts = urlsplit(proxy)
+    tunnel_headers = {}
+    if proxy_parts.username:
+        credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+    conn = http.client.HTTPSConnection(proxy_parts.hostname, proxy_parts.port or 80, timeout=30)
+    conn.set_tunnel(host, headers=tunnel_headers)
+    return conn
+
+def get_connection(host: str) -> http.client.HTTPSConnection:
+    """Return this thread's persistent connection to host."""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None or _thread_local.host != host:
+        if conn is not None:
+            conn.close()
+        conn = _thread_local.conn = open_connection(host)
+        _thread_local.host = host
+    return conn
+
+def send_request(url: str, headers: dict[str, str]) -> http.client.HTTPResponse:
+    """GET url, following redirects as urlopen does."""
+    for _ in range(MAX_REDIRECTS + 1):
+        response = send_once(url, headers)
+        location = response.headers.get("Location")
+        if response.status not in REDIRECT_STATUSES or not location:
+            return response
+        # Drain the redirect body so the connection can be reused.
+        response.read()
+        url = urljoin(url, location)
+    raise HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+def send_once(url: str, headers: dict[str, str]) -> http.client.HTTPResponse:
+    """GET url over the thread's keep-alive connection, reconnecting once if it was dropped."""
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    for attempt in range(2):
+        conn = get_connection(parts.netloc)
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn.getresponse()
+        except (http.client.HTTPException, OSError) as e:
+            # The next request on a closed connection opens a fresh one.
+            conn.close()
+            if attempt:
+                raise URLError(e) from e
+
+def rate_limit_wait(error: HTTPError, attempt: int) -> float | None:
+    """Seconds to wait before retrying a rate-limited request, or None if it should not be retried."""
+    if error.code not in (403, 429):
+        return None
+    headers = error.headers
+    retry_after = headers.get("Retry-After", "")
+    reset = headers.get("X-RateLimit-Reset", "")
+    if retry_after.isdigit():
+        wait = float(retry_after)
+    elif headers.get("X-RateLimit-Remaining") == "0" and reset.isdigit():
+        wait = max(int(reset) - time.time(), 0)
+        if wait > MAX_RETRY_WAIT:
+            return None
+        # Pad past the reset second, which may not have fully elapsed yet.
+        return wait + 1
+    elif error.code == 429:
+        wait = 2 ** attempt
+    else:
+        # A 403 without rate limit headers is a permission error.
+        return None
+    return wait if wait <= MAX_RETRY_WAIT else None
+
+def make_request(url: str, token: str | None = None, parse: Callable[[Any], Any] | None = None, cache: dict[str, Any] | None = None) -> Any:
     headers = {
         "Accept": "application/vnd.github.v3+json",
         "User-Agent": "GitHub-AI-Trending-Fetcher/1.0",
@@ -50,90 +187,143 @@ def make_request(url: str, token: str | None = None) -> dict[str, Any]:
     if token:
         headers["Authorization"] = f"token {token}"
     
-    request = Request(url, headers=headers)
-    try:
-        with urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as e:
-        if e.code == 403:
-            print(f"Rate limit exceeded. Try again later or use a token.", file=sys.stderr)
-        raise
-    except URLError as e:
-        print(f"Network error: {e}", file=sys.stderr)
-        raise
-
-def search_repositories(query: str, token: str | None = None, sort: str = "stars", order: str = "desc", per_page: int = 30) -> list[dict]:
+    # Conditional request: GitHub answers 304 without a body when the result
+    # is unchanged, and 304s do not count against the rate limit.
+    cached = cache.get(url) if cache is not None else None
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+    
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            response = send_request(url, headers)
+            try:
+                if response.status >= 300:
+                    raise HTTPError(url, response.status, response.reason, response.headers, None)
+                if parse:
+                    result = parse(response)
+                else:
+                    body = response.read()
+                    result = orjson.loads(body) if orjson else json.loads(body)
+            finally:
+                # Drain whatever the parser left unread so the connection can be reused.
+                response.read()
+            etag = response.headers.get("ETag")
+            if cache is not None and etag:
+                cache[url] = {"etag": etag, "data": result}
+            return result
+        except HTTPError as e:
+            if e.code == 304 and cached:
+                return cached["data"]
+            wait = rate_limit_wait(e, attempt)
+            if wait is not None and attempt < MAX_RATE_LIMIT_RETRIES:
+                print(f"Rate limited, retrying in {wait:.0f}s: {url}", file=sys.stderr)
+                time.sleep(wait)
+                continue
+            if e.code in (403, 429):
+                print(f"Rate limit exceeded. Try again later or use a token.", file=sys.stderr)
+            raise
+        except URLError as e:
+            print(f"Network error: {e}", file=sys.stderr)
+            raise
+
+def parse_search_items(response) -> list[dict]:
+    """Parse search result items, keeping only REPO_FIELDS. Streams via ijson when installed."""
+    if ijson:
+        items = ijson.items(response, "items.item", use_float=True)
+    else:
+        body = response.read()
+        items = (orjson.loads(body) if orjson else json.loads(body)).get("items", [])
+    return [{k: v for k, v in item.items() if k in REPO_FIELDS} for item in items]
+
+def search_repositories(query: str, token: str | None = None, sort: str = "stars", order: str = "desc", per_page: int = 30, cache: dict[str, Any] | None = None) -> list[dict]:
     url = f"{GITHUB_API_BASE}/search/repositories?q={query}&sort={sort}&order={order}&per_page={per_page}"
-    result = make_request(url, token)
-    return result.get("items", [])
+    return make_request(url, token, parse=parse_search_items, cache=cache)
 
-def get_trending_by_topic(topic: str, token: str | None = None, per_page: int = 20) -> list[dict]:
+def get_trending_by_topic(topic: str, token: str | None = None, per_page: int = 20, cache: dict[str, Any] | None = None) -> list[dict]:
     url = f"{GITHUB_API_BASE}/search/repositories?q=topic:{topic}&sort=stars&order=desc&per_page={per_page}"
-    result = make_request(url, token)
-    return result.get("items", [])
+    return make_request(url, token, parse=parse_search_items, cache=cache)
 
 def normalize_repo(repo: dict) -> dict:
+    get = repo.get
+    owner = get("owner") or {}
+    license_info = get("license")
     return {
-        "id": repo.get("id"),
-        "name": repo.get("name"),
-        "full_name": repo.get("full_name"),
-        "description": repo.get("description", ""),
-        "html_url": repo.get("html_url"),
-        "stargazers_count": repo.get("stargazers_count", 0),
-        "forks_count": repo.get("forks_count", 0),
-        "open_issues_count": repo.get("open_issues_count", 0),
-        "watchers_count": repo.get("watchers_count", 0),
-        "language": repo.get("language"),
-        "topics": repo.get("topics", []),
-        "created_at": repo.get("created_at"),
-        "updated_at": repo.get("updated_at"),
-        "pushed_at": repo.get("pushed_at"),
+        "id": get("id"),
+        "name": get("name"),
+        "full_name": get("full_name"),
+        "description": get("description", ""),
+        "html_url": get("html_url"),
+        "stargazers_count": get("stargazers_count", 0),
+        "forks_count": get("forks_count", 0),
+        "open_issues_count": get("open_issues_count", 0),
+        "watchers_count": get("watchers_count", 0),
+        "language": get("language"),
+        "topics": get("topics", []),
+        "created_at": get("created_at"),
+        "updated_at": get("updated_at"),
+        "pushed_at": get("pushed_at"),
         "owner": {
-            "login": repo.get("owner", {}).get("login"),
-            "avatar_url": repo.get("owner", {}).get("avatar_url"),
-            "type": repo.get("owner", {}).get("type"),
+            "login": owner.get("login"),
+            "avatar_url": owner.get("avatar_url"),
+            "type": owner.get("type"),
         },
-        "license": repo.get("license", {}).get("spdx_id") if repo.get("license") else None,
-        "homepage": repo.get("homepage"),
-        "archived": repo.get("archived", False),
-        "fork": repo.get("fork", False),
+        "license": license_info.get("spdx_id") if license_info else None,
+        "homepage": get("homepage"),
+        "archived": get("archived", False),
+        "fork": get("fork", False),
     }
 
-def deduplicate_repos(repos: list[dict]) -> list[dict]:
-    seen = set()
-    unique = []
-    for repo in repos:
-        full_name = repo.get("full_name")
-        if full_name and full_name not in seen:
-            seen.add(full_name)
-            unique.append(repo)
-    return unique
-
-def fetch_all_trending(token: str | None = None) -> dict[str, Any]:
+def fetch_all_trending(token: str | None = None, cache: dict[str, Any] | None = None, limit: int | None = None) -> dict[str, Any]:
     all_repos = []
+    seen = set()
     
-    print("Fetching repositories by search queries...", file=sys.stderr)
-    for query in SEARCH_QUERIES:
-        try:
-            repos = search_repositories(query, token, per_page=20)
-            all_repos.extend(repos)
-            print(f"  Query '{query}': found {len(repos)} repos", file=sys.stderr)
-        except Exception as e:
-            print(f"  Query '{query}' failed: {e}", file=sys.stderr)
+    def collect(repos: list[dict]) -> None:
+        # Deduplicate by full_name before normalizing, since query and topic
+        # results overlap heavily.
+        for repo in repos:
+            full_name = repo.get("full_name")
+            if full_name and full_name not in seen:
+                seen.add(full_name)
+                all_repos.append(repo)
     
-    print("Fetching repositories by topics...", file=sys.stderr)
-    for topic in TOPICS:
-        try:
-            repos = get_trending_by_topic(topic, token, per_page=15)
-            all_repos.extend(repos)
-            print(f"  Topic '{topic}': found {len(repos)} repos", file=sys.stderr)
-        except Exception as e:
-            print(f"  Topic '{topic}' failed: {e}", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        query_futures = [
+            (query, executor.submit(search_repositories, query, token, per_page=20, cache=cache))
+            for query in SEARCH_QUERIES
+        ]
+        topic_futures = [
+            (topic, executor.submit(get_trending_by_topic, topic, token, per_page=15, cache=cache))
+            for topic in TOPICS
+        ]
+        
+        print("Fetching repositories by search queries...", file=sys.stderr)
+        for query, future in query_futures:
+            try:
+                repos = future.result()
+                collect(repos)
+                print(f"  Query '{query}': found {len(repos)} repos", file=sys.stderr)
+            except Exception as e:
+                print(f"  Query '{query}' failed: {e}", file=sys.stderr)
+        
+        print("Fetching repositories by topics...", file=sys.stderr)
+        for topic, future in topic_futures:
+            try:
+                repos = future.result()
+                collect(repos)
+                print(f"  Topic '{topic}': found {len(repos)} repos", file=sys.stderr)
+            except Exception as e:
+                print(f"  Topic '{topic}' failed: {e}", file=sys.stderr)
     
-    normalized = [normalize_repo(r) for r in all_repos]
-    unique = deduplicate_repos(normalized)
+    unique = list(map(normalize_repo, all_repos))
     
-    unique.sort(key=lambda x: x.get("stargazers_count", 0), reverse=True)
+    # normalize_repo guarantees stargazers_count, so a C-level itemgetter key suffices.
+    by_stars = itemgetter("stargazers_count")
+    if limit is not None:
+        # Only the top `limit` repos are kept, so select them with a bounded
+        # heap instead of sorting everything. Ties keep fetch order, as sort does.
+        unique = heapq.nlargest(limit, unique, key=by_stars)
+    else:
+        unique.sort(key=by_stars, reverse=True)
     
     return {
         "fetched_at": datetime.now(timezone.utc).isoformat(),
@@ -147,20 +337,23 @@ def main():
     parser = argparse.ArgumentParser(description="Fetch trending AI skill/agent projects from GitHub")
     parser.add_argument("-o", "--output", default="trending.json", help="Output JSON file path")
     parser.add_argument("-l", "--limit", type=int, default=100, help="Maximum number of repositories to include")
+    parser.add_argument("--etag-cache", default=ETAG_CACHE_PATH, help="ETag cache file for conditional requests (empty to disable)")
     args = parser.parse_args()
     
     token = get_github_token()
     if not token:
         print("Warning: No GITHUB_TOKEN or GH_TOKEN environment variable set. Rate limits may apply.", file=sys.stderr)
     
-    data = fetch_all_trending(token)
-    
-    data["repositories"] = data["repositories"][:args.limit]
-    data["total_count"] = len(data["repositories"])
+    cache = load_etag_cache(args.etag_cache) if args.etag_cache else None
+    data = fetch_all_trending(token, cache, limit=args.limit)
+    if cache is not None:
+        save_etag_cache(cache, args.etag_cache)
     
     output_path = os.path.abspath(args.output)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson:
+        Path(output_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(output_path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     
     print(f"\nFetched {data['total_count']} repositories", file=sys.stderr)
     print(f"Output saved to: {output_path}", file=sys.stderr)
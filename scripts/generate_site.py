@@ -2,14 +2,33 @@
 """
 Generate a static website from trending AI skill/agent repositories data.
 Features: Card view, Table view, Category filtering, Dark/Light theme
+
+Performance note: this build is string-bound (lowercasing, substring tests,
+template filling). Numba and similar JITs do not help here, since string code
+falls back to object mode and runs slower. Keep hot paths on C-level str
+operations (see categorize_repo) and precompiled templates instead.
 """
 
+import gzip
+import hashlib
 import json
 import os
+import re
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 CATEGORY_RULES = {
     "智能体框架": {
         "keywords": ["agent-framework", "langchain", "crewai", "autogen", "llamaindex", "semantic-kernel", "agents", "multi-agent"],
@@ -45,31 +64,63 @@ CATEGORY_RULES = {
     }
 }
 
+# (keyword, category) pairs in CATEGORY_RULES priority order, flattened once
+# so categorize_repo is a single loop instead of a nested one.
+CATEGORY_KEYWORDS = tuple(
+    (keyword, category)
+    for category, rules in CATEGORY_RULES.items()
+    for keyword in rules["keywords"]
+)
+
 def categorize_repo(repo: dict) -> str:
     """Categorize a repository based on its topics and description."""
-    topics = [t.lower() for t in repo.get("topics", [])]
-    desc = (repo.get("description") or "").lower()
-    name = repo.get("name", "").lower()
-    
-    all_text = " ".join(topics + [desc, name])
+    all_text = " ".join([*repo.get("topics", []), repo.get("description") or "", repo.get("name", "")]).lower()
     
-    for category, rules in CATEGORY_RULES.items():
-        if category == "其他":
-            continue
-        for keyword in rules["keywords"]:
-            if keyword in all_text:
-                return category
+    for keyword, category in CATEGORY_KEYWORDS:
+        if keyword in all_text:
+            return category
     
     return "其他"
 
-def get_html_template():
-    return '''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitHub AI Skill 热门项目</title>
-    <style>
+def minify_markup(text: str) -> str:
+    """Strip indentation and blank lines from template markup.
+
+    Only leading/trailing whitespace per line is removed and line breaks are
+    kept, so inline spacing, JS statement boundaries and // comments survive.
+    """
+    return "\n".join(stripped for line in text.splitlines() if (stripped := line.strip()))
+
+PLACEHOLDER_RE = re.compile(r"__([A-Z_]+)__")
+
+SITE_HASH_PATH = Path(".cache") / "site_hash"
+
+# Repository fields read by the page script; everything else fetch_trending
+# records (timestamps, license, issue counts, ...) is left out of the
+# embedded JSON.
+CLIENT_FIELDS = (
+    "full_name", "name", "description", "description_zh", "html_url",
+    "stargazers_count", "forks_count", "language", "topics", "category",
+)
+
+# Pixel size requested from GitHub's avatar service: twice the 48px card
+# avatar for high-DPI screens, instead of the default 460px original.
+AVATAR_SIZE = 96
+
+# Header background tile, written to assets/pattern.svg and referenced from
+# SITE_CSS (relative to the stylesheet).
+PATTERN_SVG = minify_markup('''
+<svg width="60" height="60" viewBox="0 0 60 60" xmlns="http://www.w3.org/2000/svg">
+    <g fill="none" fill-rule="evenodd">
+        <g fill="#ffffff" fill-opacity="0.05">
+            <path d="M36 34v-4h-2v4h-4v2h4v4h2v-4h4v-2h-4zm0-30V0h-2v4h-4v2h4v4h2V6h4V4h-4zM6 34v-4H4v4H0v2h4v4h2v-4h4v-2H6zM6 4V0H4v4H0v2h4v4h2V6h4V4H6z"/>
+        </g>
+    </g>
+</svg>
+''')
+
+# Stylesheet written to assets/site.css next to index.html, so browsers can
+# cache it across data updates instead of re-downloading it inline.
+SITE_CSS = minify_markup('''
         :root {
             --primary: #6366f1;
             --primary-light: #818cf8;
@@ -233,7 +284,7 @@ def get_html_template():
             left: 0;
             right: 0;
             bottom: 0;
-            background: url("data:image/svg+xml,%3Csvg width='60' height='60' viewBox='0 0 60 60' xmlns='http://www.w3.org/2000/svg'%3E%3Cg fill='none' fill-rule='evenodd'%3E%3Cg fill='%23ffffff' fill-opacity='0.05'%3E%3Cpath d='M36 34v-4h-2v4h-4v2h4v4h2v-4h4v-2h-4zm0-30V0h-2v4h-4v2h4v4h2V6h4V4h-4zM6 34v-4H4v4H0v2h4v4h2v-4h4v-2H6zM6 4V0H4v4H0v2h4v4h2V6h4V4H6z'/%3E%3C/g%3E%3C/g%3E%3C/svg%3E");
+            background: url("pattern.svg");
             opacity: 0.3;
         }
         
@@ -913,7 +964,15 @@ def get_html_template():
             .search-box input { width: 100%; }
             .table-desc { max-width: 150px; }
         }
-    </style>
+''')
+
+HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitHub AI Skill 热门项目</title>
+    <link rel="stylesheet" href="assets/site.css?v=__CSS_VERSION__">
 </head>
 <body>
     <header>
@@ -961,9 +1020,7 @@ def get_html_template():
             __FILTER_BUTTONS__
         </div>
         
-        <div class="repo-grid" id="cardView">
-            __REPO_CARDS__
-        </div>
+        <div class="repo-grid" id="cardView"></div>
         
         <div class="table-container hidden" id="tableView">
             <table class="data-table">
@@ -978,9 +1035,7 @@ def get_html_template():
                         <th>语言</th>
                     </tr>
                 </thead>
-                <tbody id="tableBody">
-                    __TABLE_ROWS__
-                </tbody>
+                <tbody id="tableBody"></tbody>
             </table>
         </div>
         
@@ -1037,8 +1092,38 @@ def get_html_template():
         <p>数据来源: GitHub API | 自动更新: GitHub Actions</p>
     </footer>
     
+    <script id="reposData" type="application/json">__REPOS_JSON__</script>
     <script>
-        const repos = __REPOS_JSON__;
+        const repos = JSON.parse(document.getElementById('reposData').textContent);
+        
+        // Elements used on every filter and render, looked up once
+        const searchInput = document.getElementById('searchInput');
+        const cardView = document.getElementById('cardView');
+        const tableView = document.getElementById('tableView');
+        const tableBody = document.getElementById('tableBody');
+        const noResults = document.getElementById('noResults');
+        const translateBtn = document.getElementById('translateBtn');
+        const viewButtons = document.querySelectorAll('.view-btn');
+        const filterButtons = document.querySelectorAll('.filter-btn[data-filter]');
+        let activeCategory = 'all';
+        
+        const LANG_MAP = {
+            'JavaScript': 'lang-javascript',
+            'Python': 'lang-python',
+            'TypeScript': 'lang-typescript',
+            'Go': 'lang-go',
+            'Rust': 'lang-rust',
+            'Java': 'lang-java',
+            'C++': 'lang-cpp',
+            'Ruby': 'lang-ruby'
+        };
+        
+        // Derive the search text and language class once, instead of on every render
+        repos.forEach(r => {
+            r._langClass = getLanguageClass(r.language);
+            r._search = [r.name, r.description || '', r.description_zh || '', r.owner.login, ...(r.topics || [])].join('\\n').toLowerCase();
+        });
+        
         const categories = __CATEGORIES_JSON__;
         let showChinese = false;
         let currentSort = { field: 'rank', order: 'asc' };
@@ -1050,18 +1135,15 @@ def get_html_template():
         }
         
         function getLanguageClass(lang) {
-            if (!lang) return 'lang-default';
-            const langMap = {
-                'JavaScript': 'lang-javascript',
-                'Python': 'lang-python',
-                'TypeScript': 'lang-typescript',
-                'Go': 'lang-go',
-                'Rust': 'lang-rust',
-                'Java': 'lang-java',
-                'C++': 'lang-cpp',
-                'Ruby': 'lang-ruby'
+            return (lang && LANG_MAP[lang]) || 'lang-default';
+        }
+        
+        function debounce(fn, delay) {
+            let timer;
+            return (...args) => {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn(...args), delay);
             };
-            return langMap[lang] || 'lang-default';
         }
         
         function formatNumber(num) {
@@ -1092,95 +1174,273 @@ def get_html_template():
             return repo.description || '暂无描述';
         }
         
-        function renderCardView(reposToRender) {
-            const grid = document.getElementById('cardView');
-            
-            grid.innerHTML = reposToRender.map((repo, index) => `
-                <div class="repo-card" data-category="${repo.category}">
-                    <div class="repo-header">
-                        <img class="repo-avatar" src="${repo.owner.avatar_url}" alt="${repo.owner.login}">
-                        <div class="repo-info">
-                            <h3 class="repo-name">
-                                <a href="${repo.html_url}" target="_blank">${repo.name}</a>
-                                <span class="repo-category">${repo.category}</span>
-                            </h3>
-                            <div class="repo-owner">by ${repo.owner.login}</div>
-                        </div>
+        // Card and row markup is parsed once into <template>s and cloned per
+        // repo; text goes in through textContent, so no HTML is re-parsed.
+        function createTemplate(html) {
+            const template = document.createElement('template');
+            template.innerHTML = html;
+            return template.content.firstElementChild;
+        }
+        
+        const cardTemplate = createTemplate(`
+            <div class="repo-card">
+                <div class="repo-header">
+                    <img class="repo-avatar" loading="lazy" decoding="async">
+                    <div class="repo-info">
+                        <h3 class="repo-name">
+                            <a target="_blank"></a>
+                            <span class="repo-category"></span>
+                        </h3>
+                        <div class="repo-owner"></div>
                     </div>
-                    <p class="repo-desc">${getDescription(repo)}</p>
-                    <div class="repo-meta">
-                        <span class="stars">⭐ ${formatNumber(repo.stargazers_count)}</span>
-                        <span class="forks">🍴 ${formatNumber(repo.forks_count)}</span>
-                        ${repo.language ? `<span><span class="language-dot ${getLanguageClass(repo.language)}"></span>${repo.language}</span>` : ''}
-                    </div>
-                    ${repo.topics && repo.topics.length > 0 ? `
-                        <div class="repo-topics">
-                            ${repo.topics.slice(0, 5).map(t => `<span class="topic">${t}</span>`).join('')}
-                        </div>
-                    ` : ''}
                 </div>
-            `).join('');
+                <p class="repo-desc"></p>
+                <div class="repo-meta">
+                    <span class="stars"></span>
+                    <span class="forks"></span>
+                </div>
+            </div>
+        `);
+        
+        const rowTemplate = createTemplate(`
+            <tr>
+                <td class="table-number"></td>
+                <td>
+                    <div class="table-name">
+                        <img class="table-avatar" loading="lazy" decoding="async">
+                        <a target="_blank"></a>
+                    </div>
+                </td>
+                <td><span class="table-category"></span></td>
+                <td class="table-desc"></td>
+                <td class="table-stars table-number"></td>
+                <td class="table-forks table-number"></td>
+                <td></td>
+            </tr>
+        `);
+        
+        function createLanguageLabel(tagName, repo) {
+            const label = document.createElement(tagName);
+            const dot = document.createElement('span');
+            dot.className = `language-dot ${repo._langClass}`;
+            label.append(dot, repo.language);
+            return label;
+        }
+        
+        function createRepoCard(repo) {
+            const card = cardTemplate.cloneNode(true);
+            card.dataset.category = repo.category;
+            
+            const avatar = card.querySelector('.repo-avatar');
+            avatar.src = repo.owner.avatar_url;
+            avatar.alt = repo.owner.login;
+            
+            const link = card.querySelector('.repo-name a');
+            link.href = repo.html_url;
+            link.textContent = repo.name;
+            
+            card.querySelector('.repo-category').textContent = repo.category;
+            card.querySelector('.repo-owner').textContent = `by ${repo.owner.login}`;
+            setCardDescription(card, repo);
+            card.querySelector('.stars').textContent = `⭐ ${formatNumber(repo.stargazers_count)}`;
+            card.querySelector('.forks').textContent = `🍴 ${formatNumber(repo.forks_count)}`;
+            
+            if (repo.language) {
+                card.querySelector('.repo-meta').appendChild(createLanguageLabel('span', repo));
+            }
+            
+            if (repo.topics && repo.topics.length > 0) {
+                const topics = document.createElement('div');
+                topics.className = 'repo-topics';
+                for (const t of repo.topics.slice(0, 5)) {
+                    const topic = document.createElement('span');
+                    topic.className = 'topic';
+                    topic.textContent = t;
+                    topics.appendChild(topic);
+                }
+                card.appendChild(topics);
+            }
+            
+            return card;
         }
         
-        function renderTableView(reposToRender) {
-            const tbody = document.getElementById('tableBody');
+        function createTableRow(repo, index) {
+            const row = rowTemplate.cloneNode(true);
+            row.dataset.category = repo.category;
+            const cells = row.children;
+            
+            cells[0].textContent = index + 1;
+            
+            const avatar = row.querySelector('.table-avatar');
+            avatar.src = repo.owner.avatar_url;
+            avatar.alt = repo.owner.login;
+            
+            const link = row.querySelector('.table-name a');
+            link.href = repo.html_url;
+            link.textContent = repo.name;
+            
+            row.querySelector('.table-category').textContent = repo.category;
+            
+            setRowDescription(row, repo);
+            cells[4].textContent = `⭐ ${formatNumberFull(repo.stargazers_count)}`;
+            cells[5].textContent = `🍴 ${formatNumberFull(repo.forks_count)}`;
+            
+            if (repo.language) {
+                const lang = createLanguageLabel('div', repo);
+                lang.className = 'table-lang';
+                cells[6].appendChild(lang);
+            } else {
+                cells[6].textContent = '-';
+            }
             
-            tbody.innerHTML = reposToRender.map((repo, index) => `
-                <tr data-category="${repo.category}">
-                    <td class="table-number">${index + 1}</td>
-                    <td>
-                        <div class="table-name">
-                            <img class="table-avatar" src="${repo.owner.avatar_url}" alt="${repo.owner.login}">
-                            <a href="${repo.html_url}" target="_blank">${repo.name}</a>
-                        </div>
-                    </td>
-                    <td><span class="table-category">${repo.category}</span></td>
-                    <td class="table-desc" title="${getDescription(repo)}">${getDescription(repo)}</td>
-                    <td class="table-stars table-number">⭐ ${formatNumberFull(repo.stargazers_count)}</td>
-                    <td class="table-forks table-number">🍴 ${formatNumberFull(repo.forks_count)}</td>
-                    <td>
-                        ${repo.language ? `
-                            <div class="table-lang">
-                                <span class="language-dot ${getLanguageClass(repo.language)}"></span>
-                                ${repo.language}
-                            </div>
-                        ` : '-'}
-                    </td>
-                </tr>
-            `).join('');
+            return row;
         }
         
-        function filterRepos() {
-            const searchInput = document.getElementById('searchInput');
-            const searchTerm = searchInput ? searchInput.value.toLowerCase().trim() : '';
-            const activeCategoryFilter = document.querySelector('.filter-btn[data-filter].active');
+        function setCardDescription(card, repo) {
+            card.querySelector('.repo-desc').textContent = getDescription(repo);
+        }
+        
+        function setRowDescription(row, repo) {
+            const cell = row.querySelector('.table-desc');
+            const description = getDescription(repo);
+            cell.title = description;
+            cell.textContent = description;
+        }
+        
+        // Only the first RENDER_BATCH_SIZE items are built up front; the next
+        // batch is appended when the last rendered item nears the viewport.
+        const RENDER_BATCH_SIZE = 60;
+        
+        // Safari has no requestIdleCallback; give it short timer slices instead
+        const requestIdle = window.requestIdleCallback || (callback => setTimeout(() => {
+            const start = Date.now();
+            callback({ timeRemaining: () => Math.max(0, 8 - (Date.now() - start)) });
+        }, 1));
+        
+        // Returns a function that rewrites the descriptions of the nodes built
+        // so far, so a translation update leaves the rendered list in place.
+        function renderInBatches(container, items, createItem, setDescription) {
+            if (container._batchObserver) container._batchObserver.disconnect();
+            let next = 0;
+            let prepared = [];
+            
+            const observer = new IntersectionObserver(entries => {
+                if (entries.some(e => e.isIntersecting)) {
+                    observer.disconnect();
+                    appendBatch();
+                }
+            }, { rootMargin: '800px 0px' });
+            container._batchObserver = observer;
+            
+            function appendBatch() {
+                const fragment = document.createDocumentFragment();
+                const end = Math.min(next + RENDER_BATCH_SIZE, items.length);
+                fragment.append(...prepared);
+                for (let i = next + prepared.length; i < end; i++) {
+                    fragment.appendChild(createItem(items[i], i));
+                }
+                prepared = [];
+                next = end;
+                container.appendChild(fragment);
+                if (next < items.length) {
+                    observer.observe(container.lastElementChild);
+                    requestIdle(prepareBatch);
+                }
+            }
+            
+            // Build the next batch's nodes while the main thread is idle, so
+            // appending it on scroll is a single insertion.
+            function prepareBatch(deadline) {
+                if (container._batchObserver !== observer) return;
+                const end = Math.min(next + RENDER_BATCH_SIZE, items.length);
+                let i = next + prepared.length;
+                while (i < end && deadline.timeRemaining() > 1) {
+                    prepared.push(createItem(items[i], i));
+                    i++;
+                }
+                if (i < end) requestIdle(prepareBatch);
+            }
             
-            const categoryFilter = activeCategoryFilter ? activeCategoryFilter.dataset.filter : 'all';
+            container.replaceChildren();
+            appendBatch();
+            
+            return () => {
+                const rendered = container.children;
+                for (let i = 0; i < rendered.length; i++) {
+                    setDescription(rendered[i], items[i]);
+                }
+                prepared.forEach((node, i) => setDescription(node, items[next + i]));
+            };
+        }
+        
+        function renderCardView(reposToRender) {
+            return renderInBatches(cardView, reposToRender, createRepoCard, setCardDescription);
+        }
+        
+        function renderTableView(reposToRender) {
+            return renderInBatches(tableBody, reposToRender, createTableRow, setRowDescription);
+        }
+        
+        // repos arrive sorted by stars, which is the rank order, so the
+        // default sort is free. Other sorts order an index array over keys
+        // extracted once, and each sorted list is kept for reuse.
+        const SORT_KEYS = {
+            stars: repos.map(r => r.stargazers_count),
+            forks: repos.map(r => r.forks_count),
+            description: repos.map(r => (r.description || '').toLowerCase())
+        };
+        const sortedRepos = new Map();
+        
+        function getSortedRepos(field, order) {
+            const key = `${field}|${order}`;
+            let sorted = sortedRepos.get(key);
+            if (sorted) return sorted;
+            
+            const dir = order === 'asc' ? 1 : -1;
+            if (field === 'rank') {
+                sorted = dir > 0 ? repos : [...repos].reverse();
+            } else {
+                const keys = SORT_KEYS[field];
+                const indices = repos.map((_, i) => i);
+                // Ties keep rank order
+                indices.sort((a, b) => keys[a] < keys[b] ? -dir : keys[a] > keys[b] ? dir : a - b);
+                sorted = indices.map(i => repos[i]);
+            }
+            sortedRepos.set(key, sorted);
+            return sorted;
+        }
+        
+        // Filtered and sorted results, keyed by the inputs that produce them
+        const filterCache = new Map();
+        const FILTER_CACHE_SIZE = 32;
+        
+        function getFilteredRepos(categoryFilter, searchTerm) {
+            const key = `${categoryFilter}|${searchTerm}|${currentSort.field}|${currentSort.order}`;
+            let filtered = filterCache.get(key);
+            if (filtered) return filtered;
             
-            let filtered = [...repos];
+            filtered = getSortedRepos(currentSort.field, currentSort.order);
             
             // Category filter
             if (categoryFilter !== 'all') {
                 filtered = filtered.filter(r => r.category === categoryFilter);
             }
             
-            // Sort by Stars
-            filtered = filtered.sort((a, b) => b.stargazers_count - a.stargazers_count);
-            
             // Search filter
             if (searchTerm.length > 0) {
-                filtered = filtered.filter(r =>
-                    r.name.toLowerCase().includes(searchTerm) ||
-                    (r.description && r.description.toLowerCase().includes(searchTerm)) ||
-                    (r.description_zh && r.description_zh.toLowerCase().includes(searchTerm)) ||
-                    (r.topics && r.topics.some(t => t.toLowerCase().includes(searchTerm))) ||
-                    r.owner.login.toLowerCase().includes(searchTerm)
-                );
+                filtered = filtered.filter(r => r._search.includes(searchTerm));
             }
             
-            const noResults = document.getElementById('noResults');
-            const cardView = document.getElementById('cardView');
-            const tableView = document.getElementById('tableView');
+            if (filterCache.size >= FILTER_CACHE_SIZE) {
+                filterCache.delete(filterCache.keys().next().value);
+            }
+            filterCache.set(key, filtered);
+            return filtered;
+        }
+        
+        function filterRepos() {
+            const searchTerm = searchInput.value.toLowerCase().trim();
+            const filtered = getFilteredRepos(activeCategory, searchTerm);
             
             if (filtered.length === 0) {
                 cardView.classList.add('hidden');
@@ -1197,23 +1457,44 @@ def get_html_template():
             }
             
             if (!cardView.classList.contains('hidden')) {
-                renderCardView(filtered);
+                renderView(cardView, renderCardView, filtered);
             }
             if (!tableView.classList.contains('hidden')) {
-                renderTableView(filtered);
+                renderView(tableView, renderTableView, filtered);
             }
         }
         
+        // Bumped whenever the displayed descriptions change (translation
+        // toggled or extended), so renderView knows to update them.
+        let descriptionsVersion = 0;
+        
+        function refreshDescriptions() {
+            descriptionsVersion++;
+            filterRepos();
+        }
+        
+        // Skip the render when the view already shows this exact list, and
+        // only rewrite descriptions in place when those are all that changed
+        function renderView(view, render, filtered) {
+            if (view._rendered === filtered) {
+                if (view._descriptionsVersion !== descriptionsVersion) {
+                    view._updateDescriptions();
+                    view._descriptionsVersion = descriptionsVersion;
+                }
+                return;
+            }
+            view._updateDescriptions = render(filtered);
+            view._rendered = filtered;
+            view._descriptionsVersion = descriptionsVersion;
+        }
+        
         // View toggle
-        document.querySelectorAll('.view-btn').forEach(btn => {
+        viewButtons.forEach(btn => {
             btn.addEventListener('click', () => {
-                document.querySelectorAll('.view-btn').forEach(b => b.classList.remove('active'));
+                viewButtons.forEach(b => b.classList.remove('active'));
                 btn.classList.add('active');
                 
                 const view = btn.dataset.view;
-                const cardView = document.getElementById('cardView');
-                const tableView = document.getElementById('tableView');
-                
                 if (view === 'card') {
                     cardView.classList.remove('hidden');
                     tableView.classList.add('hidden');
@@ -1227,16 +1508,17 @@ def get_html_template():
         });
         
         // Category filter buttons
-        document.querySelectorAll('.filter-btn[data-filter]').forEach(btn => {
+        filterButtons.forEach(btn => {
             btn.addEventListener('click', () => {
-                document.querySelectorAll('.filter-btn[data-filter]').forEach(b => b.classList.remove('active'));
+                filterButtons.forEach(b => b.classList.remove('active'));
                 btn.classList.add('active');
+                activeCategory = btn.dataset.filter;
                 filterRepos();
             });
         });
         
-        // Search
-        document.getElementById('searchInput').addEventListener('input', filterRepos);
+        // Search - wait for a pause in typing instead of re-rendering on every keystroke
+        searchInput.addEventListener('input', debounce(filterRepos, 200));
         
         // Settings Modal
         const settingsModal = document.getElementById('settingsModal');
@@ -1263,6 +1545,9 @@ def get_html_template():
             custom: ''
         };
         
+        // Saved LLM settings, parsed once; saveSettings writes them back
+        const llmSettings = JSON.parse(localStorage.getItem('llmSettings') || '{}');
+        
         function encryptKey(key) {
             if (!key) return '';
             const encoded = btoa(key);
@@ -1279,23 +1564,33 @@ def get_html_template():
             }
         }
         
+        // Decrypted API key, cached until the settings are saved again
+        let decryptedApiKey = null;
+        
+        function getApiKey() {
+            if (decryptedApiKey === null) {
+                decryptedApiKey = decryptKey(llmSettings.apiKey);
+            }
+            return decryptedApiKey;
+        }
+        
         function loadSettings() {
-            const settings = JSON.parse(localStorage.getItem('llmSettings') || '{}');
-            if (settings.provider) llmProvider.value = settings.provider;
-            if (settings.apiKey) apiKeyInput.value = decryptKey(settings.apiKey);
-            if (settings.endpoint) apiEndpoint.value = settings.endpoint;
-            if (settings.model) modelName.value = settings.model;
+            if (llmSettings.provider) llmProvider.value = llmSettings.provider;
+            if (llmSettings.apiKey) apiKeyInput.value = getApiKey();
+            if (llmSettings.endpoint) apiEndpoint.value = llmSettings.endpoint;
+            if (llmSettings.model) modelName.value = llmSettings.model;
             updateDefaultValues();
         }
         
         function saveSettings() {
-            const settings = {
+            Object.assign(llmSettings, {
                 provider: llmProvider.value,
                 apiKey: encryptKey(apiKeyInput.value),
                 endpoint: apiEndpoint.value,
                 model: modelName.value
-            };
-            localStorage.setItem('llmSettings', JSON.stringify(settings));
+            });
+            localStorage.setItem('llmSettings', JSON.stringify(llmSettings));
+            decryptedApiKey = null;
             settingsModal.classList.remove('active');
         }
         
@@ -1322,6 +1617,14 @@ def get_html_template():
         const testApiBtn = document.getElementById('testApiBtn');
         const testResult = document.getElementById('testResult');
         
+        // The reply and error text come from the API, so they go in as text
+        function showTestResult(message, color) {
+            const span = document.createElement('span');
+            span.style.color = `var(${color})`;
+            span.textContent = message;
+            testResult.replaceChildren(span);
+        }
+        
         testApiBtn.addEventListener('click', async () => {
             const provider = llmProvider.value;
             const apiKey = apiKeyInput.value;
@@ -1329,13 +1632,13 @@ def get_html_template():
             const model = modelName.value || defaultModels[provider];
             
             if (!apiKey) {
-                testResult.innerHTML = '<span style="color: var(--accent-red);">请先输入 API Key</span>';
+                showTestResult('请先输入 API Key', '--accent-red');
                 return;
             }
             
             testApiBtn.disabled = true;
             testApiBtn.textContent = '测试中...';
-            testResult.innerHTML = '<span style="color: var(--text-secondary);">正在连接 API...</span>';
+            showTestResult('正在连接 API...', '--text-secondary');
             
             try {
                 const response = await fetch(endpoint, {
@@ -1361,13 +1664,13 @@ def get_html_template():
                 
                 if (response.ok && data.choices && data.choices[0]) {
                     const reply = data.choices[0].message.content;
-                    testResult.innerHTML = `<span style="color: var(--accent-green);">✓ 连接成功！模型回复：${reply}</span>`;
+                    showTestResult(`✓ 连接成功！模型回复：${reply}`, '--accent-green');
                 } else {
                     const errorMsg = data.error?.message || JSON.stringify(data);
-                    testResult.innerHTML = `<span style="color: var(--accent-red);">✗ 连接失败：${errorMsg}</span>`;
+                    showTestResult(`✗ 连接失败：${errorMsg}`, '--accent-red');
                 }
             } catch (e) {
-                testResult.innerHTML = `<span style="color: var(--accent-red);">✗ 连接失败：${e.message}</span>`;
+                showTestResult(`✗ 连接失败：${e.message}`, '--accent-red');
             }
             
             testApiBtn.disabled = false;
@@ -1379,12 +1682,13 @@ def get_html_template():
         clearCacheBtn.addEventListener('click', () => {
             if (confirm('确定要清除所有翻译缓存吗？')) {
                 localStorage.removeItem('translatedCache');
+                localStorage.removeItem('textTranslatedCache');
                 translatedCache = {};
+                textTranslations.clear();
                 showChinese = false;
-                const translateBtn = document.getElementById('translateBtn');
                 translateBtn.textContent = '显示中文';
                 translateBtn.classList.remove('active');
-                filterRepos();
+                refreshDescriptions();
                 alert('翻译缓存已清除！');
             }
         });
@@ -1393,23 +1697,30 @@ def get_html_template():
         
         // Translate toggle - switch between English and Chinese
         let isTranslating = false;
+        const TRANSLATE_CONCURRENCY = 5;
+        const TRANSLATE_BATCH_SIZE = 10;
+        
+        // Translations keyed by the English text itself, so repos sharing a
+        // description, or whose star count (part of getCacheKey) changed,
+        // reuse an earlier result instead of paying for another API call.
+        const textTranslations = new Map(Object.entries(JSON.parse(localStorage.getItem('textTranslatedCache') || '{}')));
         
         function saveTranslatedCache() {
             localStorage.setItem('translatedCache', JSON.stringify(translatedCache));
+            localStorage.setItem('textTranslatedCache', JSON.stringify(Object.fromEntries(textTranslations)));
         }
         
-        async function translateWithLLM(text) {
-            const settings = JSON.parse(localStorage.getItem('llmSettings') || '{}');
-            
-            const apiKey = decryptKey(settings.apiKey);
+        // Send one chat completion request; returns the reply text, or null on failure
+        async function requestCompletion(messages, maxTokens) {
+            const apiKey = getApiKey();
             
             if (!apiKey) {
                 alert('请先在设置中配置 API Key');
-                return text;
+                return null;
             }
             
-            const endpoint = settings.endpoint || 'https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions';
-            const model = settings.model || 'qwen-turbo';
+            const endpoint = llmSettings.endpoint || 'https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions';
+            const model = llmSettings.model || 'qwen-turbo';
             
             try {
                 const response = await fetch(endpoint, {
@@ -1420,18 +1731,9 @@ def get_html_template():
                     },
                     body: JSON.stringify({
                         model: model,
-                        messages: [
-                            {
-                                role: 'system',
-                                content: '你是一个专业的翻译助手。请将用户提供的英文技术描述翻译成简洁准确的中文。只返回翻译结果，不要添加任何解释或额外内容。'
-                            },
-                            {
-                                role: 'user',
-                                content: `请将以下英文描述翻译成中文：\n\n${text}`
-                            }
-                        ],
+                        messages: messages,
                         temperature: 0.3,
-                        max_tokens: 500
+                        max_tokens: maxTokens
                     })
                 });
                 
@@ -1441,69 +1743,138 @@ def get_html_template():
                     return data.choices[0].message.content.trim();
                 }
                 
-                return text;
+                return null;
             } catch (e) {
                 console.error('Translation error:', e);
-                return text;
+                return null;
             }
         }
         
-        document.getElementById('translateBtn').addEventListener('click', async () => {
-            const btn = document.getElementById('translateBtn');
+        async function translateWithLLM(text) {
+            const reply = await requestCompletion([
+                {
+                    role: 'system',
+                    content: '你是一个专业的翻译助手。请将用户提供的英文技术描述翻译成简洁准确的中文。只返回翻译结果，不要添加任何解释或额外内容。'
+                },
+                {
+                    role: 'user',
+                    content: `请将以下英文描述翻译成中文：\\n\\n${text}`
+                }
+            ], 500);
+            return reply || text;
+        }
+        
+        // Translate several descriptions in one request, so the prompt and
+        // round trip are paid once per batch. Falls back to one request per
+        // text if the reply is not a JSON array of matching length; if the
+        // request itself failed, the texts are returned untranslated rather
+        // than retried one by one against a provider that just refused.
+        async function translateBatchWithLLM(texts) {
+            if (texts.length === 1) {
+                return [await translateWithLLM(texts[0])];
+            }
+            
+            const numbered = texts.map((t, i) => `${i + 1}. ${t.replace(/\\s+/g, ' ')}`).join('\\n');
+            const reply = await requestCompletion([
+                {
+                    role: 'system',
+                    content: '你是一个专业的翻译助手。请将用户提供的每条英文技术描述翻译成简洁准确的中文。只返回一个 JSON 字符串数组，按顺序对应每条描述，不要添加任何解释或额外内容。'
+                },
+                {
+                    role: 'user',
+                    content: `请将以下 ${texts.length} 条英文描述翻译成中文：\\n\\n${numbered}`
+                }
+            ], 300 * texts.length);
+            if (!reply) return texts;
             
+            try {
+                const match = reply.match(/\\[[\\s\\S]*\\]/);
+                const results = match && JSON.parse(match[0]);
+                if (Array.isArray(results) && results.length === texts.length) {
+                    return results.map((r, i) => (typeof r === 'string' && r.trim()) || texts[i]);
+                }
+            } catch (e) {
+                console.error('Batch translation parse error:', e);
+            }
+            // One at a time, so a worker never has more than one request in
+            // flight and TRANSLATE_CONCURRENCY still bounds the total.
+            const results = [];
+            for (const text of texts) {
+                results.push(await translateWithLLM(text));
+            }
+            return results;
+        }
+        
+        translateBtn.addEventListener('click', async () => {
             if (isTranslating) return;
             
             if (showChinese) {
                 showChinese = false;
-                btn.textContent = '显示中文';
-                btn.classList.remove('active');
-                filterRepos();
+                translateBtn.textContent = '显示中文';
+                translateBtn.classList.remove('active');
+                refreshDescriptions();
                 return;
             }
             
-            const settings = JSON.parse(localStorage.getItem('llmSettings') || '{}');
-            const apiKey = decryptKey(settings.apiKey);
+            const apiKey = getApiKey();
             if (!apiKey) {
                 alert('请先点击「设置」按钮配置 API Key');
                 return;
             }
             
             isTranslating = true;
-            btn.textContent = '翻译中...';
-            btn.classList.add('active');
+            translateBtn.textContent = '翻译中...';
+            translateBtn.classList.add('active');
             
-            let translated = 0;
-            const total = repos.length;
+            const pending = repos.filter(r => r.description && !translatedCache[getCacheKey(r)]);
             
-            for (let i = 0; i < repos.length; i++) {
-                const repo = repos[i];
-                const cacheKey = getCacheKey(repo);
-                
-                if (repo.description && !translatedCache[cacheKey]) {
-                    const translatedText = await translateWithLLM(repo.description);
-                    
-                    // Only save if translation is different from original
-                    if (translatedText !== repo.description) {
-                        translatedCache[cacheKey] = translatedText;
-                        translated++;
+            function applyTranslations() {
+                for (const repo of pending) {
+                    const translatedText = textTranslations.get(repo.description);
+                    if (translatedText) {
+                        translatedCache[getCacheKey(repo)] = translatedText;
                     }
+                }
+            }
+            
+            // Each distinct text not translated before is requested once, in
+            // batches, with a few batches in flight at a time.
+            const texts = [...new Set(pending.map(r => r.description))].filter(t => !textTranslations.has(t));
+            const batches = [];
+            for (let i = 0; i < texts.length; i += TRANSLATE_BATCH_SIZE) {
+                batches.push(texts.slice(i, i + TRANSLATE_BATCH_SIZE));
+            }
+            let done = 0;
+            
+            async function worker() {
+                while (batches.length > 0) {
+                    const batch = batches.shift();
+                    const results = await translateBatchWithLLM(batch);
                     
-                    if (translated % 5 === 0) {
-                        saveTranslatedCache();
-                        btn.textContent = `翻译中 ${Math.round((translated / total) * 100)}%`;
-                        showChinese = true;
-                        filterRepos();
-                    }
+                    // Only save if translation is different from original
+                    batch.forEach((text, i) => {
+                        if (results[i] !== text) {
+                            textTranslations.set(text, results[i]);
+                        }
+                    });
                     
-                    await new Promise(r => setTimeout(r, 300));
+                    done += batch.length;
+                    applyTranslations();
+                    saveTranslatedCache();
+                    translateBtn.textContent = `翻译中 ${Math.round((done / texts.length) * 100)}%`;
+                    showChinese = true;
+                    refreshDescriptions();
                 }
             }
             
+            await Promise.all(Array.from({ length: TRANSLATE_CONCURRENCY }, worker));
+            applyTranslations();
+            
             saveTranslatedCache();
             showChinese = true;
             isTranslating = false;
-            btn.textContent = '显示英文';
-            filterRepos();
+            translateBtn.textContent = '显示英文';
+            refreshDescriptions();
         });
         
         // Table sorting
@@ -1557,13 +1928,12 @@ def get_html_template():
             }
         });
         
-        // Initial render
-        renderCardView(repos);
-        renderTableView(repos);
+        // Initial render - only the card view is visible; the table is drawn
+        // the first time it is opened.
+        filterRepos();
         
         // Update button state if we have cached translations
         if (showChinese) {
-            const translateBtn = document.getElementById('translateBtn');
             translateBtn.textContent = '显示英文';
             translateBtn.classList.add('active');
         }
@@ -1572,10 +1942,9 @@ def get_html_template():
 </html>
 '''
 
-def format_number(num: int) -> str:
-    if num >= 1000:
-        return f"{num / 1000:.1f}k"
-    return str(num)
+# HTML_TEMPLATE minified and split on its placeholders once at import:
+# literal text at even indices, placeholder names at odd ones.
+TEMPLATE_PARTS = PLACEHOLDER_RE.split(minify_markup(HTML_TEMPLATE))
 
 def generate_filter_buttons(category_counts: dict) -> str:
     """Generate filter buttons HTML."""
@@ -1588,111 +1957,49 @@ def generate_filter_buttons(category_counts: dict) -> str:
     
     return ''.join(buttons)
 
-def generate_repo_card_html(repo: dict) -> str:
-    topics_html = ""
-    if repo.get("topics"):
-        topics = repo["topics"][:5]
-        topics_html = '<div class="repo-topics">' + "".join(
-            f'<span class="topic">{t}</span>' for t in topics
-        ) + '</div>'
-    
-    lang_html = ""
-    if repo.get("language"):
-        lang = repo["language"]
-        lang_class = {
-            "JavaScript": "lang-javascript",
-            "Python": "lang-python",
-            "TypeScript": "lang-typescript",
-            "Go": "lang-go",
-            "Rust": "lang-rust",
-            "Java": "lang-java",
-            "C++": "lang-cpp",
-            "Ruby": "lang-ruby",
-        }.get(lang, "lang-default")
-        lang_html = f'<span><span class="language-dot {lang_class}"></span>{lang}</span>'
-    
-    return f'''
-    <div class="repo-card" data-category="{repo.get("category", "其他")}">
-        <div class="repo-header">
-            <img class="repo-avatar" src="{repo["owner"]["avatar_url"]}" alt="{repo["owner"]["login"]}">
-            <div class="repo-info">
-                <h3 class="repo-name">
-                    <a href="{repo["html_url"]}" target="_blank">{repo["name"]}</a>
-                    <span class="repo-category">{repo.get("category", "其他")}</span>
-                </h3>
-                <div class="repo-owner">by {repo["owner"]["login"]}</div>
-            </div>
-        </div>
-        <p class="repo-desc">{repo.get("description") or "暂无描述"}</p>
-        <div class="repo-meta">
-            <span class="stars">⭐ {format_number(repo["stargazers_count"])}</span>
-            <span class="forks">🍴 {format_number(repo["forks_count"])}</span>
-            {lang_html}
-        </div>
-        {topics_html}
-    </div>
-    '''
+def client_repo(repo: dict) -> dict:
+    """Project a processed repository onto the fields the page script uses."""
+    slim = {key: repo[key] for key in CLIENT_FIELDS if key in repo}
+    owner = repo["owner"]
+    avatar_url = owner["avatar_url"]
+    if avatar_url:
+        avatar_url += f"{'&' if '?' in avatar_url else '?'}s={AVATAR_SIZE}"
+    slim["owner"] = {"login": owner["login"], "avatar_url": avatar_url}
+    return slim
 
-def generate_table_row_html(repo: dict, index: int) -> str:
-    lang_html = "-"
-    if repo.get("language"):
-        lang = repo["language"]
-        lang_class = {
-            "JavaScript": "lang-javascript",
-            "Python": "lang-python",
-            "TypeScript": "lang-typescript",
-            "Go": "lang-go",
-            "Rust": "lang-rust",
-            "Java": "lang-java",
-            "C++": "lang-cpp",
-            "Ruby": "lang-ruby",
-        }.get(lang, "lang-default")
-        lang_html = f'<div class="table-lang"><span class="language-dot {lang_class}"></span>{lang}</div>'
-    
-    avatar_url = repo["owner"]["avatar_url"]
-    owner_login = repo["owner"]["login"]
-    html_url = repo["html_url"]
-    name = repo["name"]
-    category = repo.get("category", "其他")
-    desc = repo.get("description") or "暂无描述"
-    stars = repo["stargazers_count"]
-    forks = repo["forks_count"]
-    
-    return f'''
-    <tr data-category="{category}">
-        <td class="table-number">{index + 1}</td>
-        <td>
-            <div class="table-name">
-                <img class="table-avatar" src="{avatar_url}" alt="{owner_login}">
-                <a href="{html_url}" target="_blank">{name}</a>
-            </div>
-        </td>
-        <td><span class="table-category">{category}</span></td>
-        <td class="table-desc" title="{desc}">{desc}</td>
-        <td class="table-stars table-number">⭐ {stars:,}</td>
-        <td class="table-forks table-number">🍴 {forks:,}</td>
-        <td>{lang_html}</td>
-    </tr>
-    '''
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly that content."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+def write_precompressed(path: Path) -> None:
+    """Write a gzip copy of path next to it, and a brotli copy when brotli is installed."""
+    data = path.read_bytes()
+    # mtime=0 keeps the gzip bytes identical for identical input.
+    write_if_changed(path.with_name(path.name + ".gz"), gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli:
+        write_if_changed(path.with_name(path.name + ".br"), brotli.compress(data, quality=11))
 
-def process_repos(repos: list) -> list:
-    """Process repositories: categorize."""
+def process_repos(repos: list) -> tuple[list, Counter]:
+    """Process repositories: categorize, and order by stars for the page's default sort."""
     processed = []
-    category_counts = {}
     
     for repo in repos:
         repo_copy = repo.copy()
         
         # Categorize
-        category = categorize_repo(repo)
-        repo_copy["category"] = category
-        category_counts[category] = category_counts.get(category, 0) + 1
+        repo_copy["category"] = categorize_repo(repo)
         
         processed.append(repo_copy)
     
+    processed.sort(key=lambda r: r.get("stargazers_count", 0), reverse=True)
+    category_counts = Counter(r["category"] for r in processed)
     return processed, category_counts
 
-def generate_site(data: dict, output_dir: str) -> None:
+def generate_site(data: dict, output_dir: str, precompress: bool = False) -> None:
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
@@ -1701,48 +2008,80 @@ def generate_site(data: dict, output_dir: str) -> None:
     print(f"\nProcessing {len(repos)} repositories...", file=sys.stderr)
     processed_repos, category_counts = process_repos(repos)
     
-    total_stars = sum(r.get("stargazers_count", 0) for r in repos)
-    
     fetched_at = data.get("fetched_at", "")
     if fetched_at:
+        # fetch_trending writes "+00:00" offsets; only rewrite a trailing "Z".
+        fetched_at_iso = fetched_at[:-1] + "+00:00" if fetched_at.endswith("Z") else fetched_at
         try:
-            dt = datetime.fromisoformat(fetched_at.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(fetched_at_iso)
             fetched_date = dt.strftime("%Y-%m-%d %H:%M")
-        except:
+        except ValueError:
             fetched_date = fetched_at[:10] if len(fetched_at) >= 10 else fetched_at
     else:
         fetched_date = datetime.now().strftime("%Y-%m-%d")
     
-    repos_json = json.dumps(processed_repos, ensure_ascii=False)
+    client_repos = list(map(client_repo, processed_repos))
+    if orjson:
+        repos_json = orjson.dumps(client_repos)
+    else:
+        repos_json = json.dumps(client_repos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # The JSON sits inside a <script> element. Escaping every "<" keeps
+    # descriptions from closing it ("</script>") or switching the tokenizer
+    # into an escaped state where the real closing tag is missed ("<!--").
+    repos_json = repos_json.replace(b"<", b"\\u003c")
     categories_json = json.dumps(category_counts, ensure_ascii=False)
     filter_buttons = generate_filter_buttons(category_counts)
-    repo_cards = "".join(generate_repo_card_html(r) for r in processed_repos)
-    table_rows = "".join(generate_table_row_html(r, i) for i, r in enumerate(processed_repos))
     
-    html = get_html_template()
-    html = html.replace("__TOTAL_COUNT__", str(len(repos)))
-    html = html.replace("__TOTAL_STARS__", f"{total_stars:,}")
-    html = html.replace("__FETCHED_DATE__", fetched_date)
-    html = html.replace("__FILTER_BUTTONS__", filter_buttons)
-    html = html.replace("__REPO_CARDS__", repo_cards)
-    html = html.replace("__TABLE_ROWS__", table_rows)
-    html = html.replace("__REPOS_JSON__", repos_json)
-    html = html.replace("__CATEGORIES_JSON__", categories_json)
+    total_stars = sum(repo.get("stargazers_count", 0) for repo in processed_repos)
+    
+    css_bytes = SITE_CSS.encode("utf-8")
+    write_if_changed(output_path / "assets" / "site.css", css_bytes)
+    write_if_changed(output_path / "assets" / "pattern.svg", PATTERN_SVG.encode("utf-8"))
     
+    subs = {
+        "CSS_VERSION": hashlib.blake2b(css_bytes, digest_size=4).hexdigest(),
+        "TOTAL_COUNT": str(len(repos)),
+        "TOTAL_STARS": f"{total_stars:,}",
+        "FETCHED_DATE": fetched_date,
+        "FILTER_BUTTONS": filter_buttons,
+        "REPOS_JSON": repos_json,
+        "CATEGORIES_JSON": categories_json,
+    }
+    
+    # Stream the template and its filled placeholders straight to the file
+    # instead of assembling the whole page in memory first.
     index_path = output_path / "index.html"
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    with open(index_path, "wb") as f:
+        for i, part in enumerate(TEMPLATE_PARTS):
+            value = subs[part] if i % 2 else part
+            f.write(value if isinstance(value, bytes) else value.encode("utf-8"))
+    
+    # For servers that serve precompressed siblings (e.g. nginx gzip_static);
+    # GitHub Pages compresses on the fly and ignores them.
+    if precompress:
+        write_precompressed(index_path)
+        write_precompressed(output_path / "assets" / "site.css")
     
     print(f"\nGenerated site with {len(repos)} repositories", file=sys.stderr)
-    print(f"Categories: {category_counts}", file=sys.stderr)
+    print(f"Categories: {dict(category_counts)}", file=sys.stderr)
     print(f"Output: {index_path}", file=sys.stderr)
 
+def compute_site_hash(input_bytes: bytes, output_dir: str, precompress: bool = False) -> str:
+    """Hash everything the generated site depends on: input data, this script, the output path and options."""
+    digest = hashlib.blake2b(input_bytes, digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(str(Path(output_dir).resolve()).encode("utf-8"))
+    digest.update(b"precompress" if precompress else b"")
+    return digest.hexdigest()
+
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Generate static website from trending data")
     parser.add_argument("-i", "--input", default="trending.json", help="Input JSON file path")
     parser.add_argument("-o", "--output", default="docs", help="Output directory")
+    parser.add_argument("-f", "--force", action="store_true", help="Regenerate even if the input is unchanged")
+    parser.add_argument("--precompress", action="store_true", help="Also write .gz (and .br, if brotli is installed) copies of the page and stylesheet")
     args = parser.parse_args()
     
     input_path = Path(args.input)
@@ -1750,10 +2089,19 @@ def main():
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         return 1
     
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    raw = input_path.read_bytes()
+    site_hash = compute_site_hash(raw, args.output, args.precompress)
+    index_path = Path(args.output) / "index.html"
+    if not args.force and index_path.exists() and SITE_HASH_PATH.exists():
+        if SITE_HASH_PATH.read_text(encoding="utf-8").strip() == site_hash:
+            print(f"Input unchanged since last build, skipping: {index_path}", file=sys.stderr)
+            return 0
+    
+    data = orjson.loads(raw) if orjson else json.loads(raw)
     
-    generate_site(data, args.output)
+    generate_site(data, args.output, args.precompress)
+    SITE_HASH_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SITE_HASH_PATH.write_text(site_hash, encoding="utf-8")
     return 0
 
 if __name__ == "__main__":